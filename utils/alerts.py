@@ -1,23 +1,119 @@
 import smtplib
-from email.mime.text import MimeText
+from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from twilio.rest import Client
+from twilio.http.http_client import TwilioHttpClient
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
+from string import Template
 import os
+import queue
+import threading
+import time
+import atexit
 from dotenv import load_dotenv
 import pandas as pd
 import json
 
-# Load environment variables
-load_dotenv()
+# Seconds before a hung SMTP/Twilio connection gives up
+_NETWORK_TIMEOUT = 10
+
+# Longest interpreter shutdown waits for queued alerts to go out
+_DRAIN_TIMEOUT = 30
+
+# Alert message templates: alert_type -> (subject, body)
+_HOTSPOT_BODY = """
+    HOTSPOT DETECTED in $location, $region
+    
+    📊 Current Concentration: $concentration particles/m³
+    🚩 Risk Level: HIGH - Immediate Action Required
+    ⏰ Detected: $now
+    
+    Immediate Actions Needed:
+    • Coordinate emergency cleanup operations
+    • Implement temporary fishing restrictions  
+    • Notify local environmental authorities
+    • Increase monitoring frequency
+    
+    View details: https://microplasticsinsight.org/dashboard?region=$region
+"""
+
+_THRESHOLD_BODY = """
+    THRESHOLD VIOLATION in $location, $region
+    
+    📈 Concentration: $concentration particles/m³
+    ⛔ Exceeds threshold of 100 particles/m³ by $excess
+    📍 Location: $location
+    
+    Recommended Actions:
+    • Schedule urgent assessment and cleanup
+    • Review local pollution sources
+    • Update community risk communications
+    
+    Full report: https://microplasticsinsight.org/reports/$region
+"""
+
+_TREND_BODY = """
+    CONCERNING TREND DETECTED in $region
+    
+    📊 $details increase over past 12 months
+    📍 Impacted Area: $location
+    ⚠️ Projected annual increase: $concentration%
+    
+    Proactive Measures Recommended:
+    • Review and strengthen prevention programs
+    • Increase monitoring in affected areas  
+    • Engage stakeholders in policy discussions
+    • Prepare additional cleanup resources
+    
+    Trend analysis: https://microplasticsinsight.org/trends/$region
+"""
+
+_NEW_UPLOAD_BODY = """
+    NEW CITIZEN SCIENCE CONTRIBUTION
+    
+    👤 Reported by community member
+    📷 Photo evidence of plastic debris
+    📍 Location: $location, $region
+    🏷️ Type: $details
+    ⏰ Reported: $now
+    
+    Actions Required:
+    • Verify and validate citizen report
+    • Add to official monitoring database
+    • Consider for cleanup prioritization
+    • Acknowledge contributor publicly
+    
+    View contribution: https://microplasticsinsight.org/contributions/$contribution_id
+"""
 
 class AlertManager:
     """Manager for sending microplastics pollution alerts"""
     
+    _templates = {
+        'hotspot': (Template("🚨 MICROPLASTICS HOTSPOT ALERT: $region"), Template(_HOTSPOT_BODY)),
+        'threshold': (Template("⚠️ THRESHOLD EXCEEDED: $region"), Template(_THRESHOLD_BODY)),
+        'trend': (Template("📈 TREND ALERT: $region"), Template(_TREND_BODY)),
+        'new_upload': (Template("🆕 NEW CITIZEN REPORT: $region"), Template(_NEW_UPLOAD_BODY))
+    }
+    
+    _priority_map = {
+        'hotspot': 'HIGH',
+        'threshold': 'MEDIUM', 
+        'trend': 'MEDIUM',
+        'new_upload': 'LOW'
+    }
+    
     def __init__(self):
+        # Load environment variables
+        load_dotenv()
+        
         self.twilio_client = None
         self.smtp_config = None
         self.alert_recipients = []
+        self._email_recipients = []  # (name, email) pairs
+        self._sms_recipients = []    # (name, phone) pairs
         self.thresholds = {
             'concentration': 100.0,  # particles/m³
             'hotspot_count': 5,
@@ -28,16 +124,30 @@ class AlertManager:
         self._init_twilio()
         self._init_email()
         self.load_recipients()
+        
+        # Network delivery happens on a background thread so callers don't block
+        self._alert_queue = queue.Queue(maxsize=1000)
+        self._worker = threading.Thread(target=self._alert_worker, name='alert-worker', daemon=True)
+        self._worker.start()
+        atexit.register(self.drain)
     
     def _init_twilio(self):
         """Initialize Twilio client for SMS alerts"""
         account_sid = os.getenv('TWILIO_ACCOUNT_SID')
         auth_token = os.getenv('TWILIO_AUTH_TOKEN')
         from_number = os.getenv('TWILIO_PHONE_NUMBER')
+        self._twilio_from = from_number
         
         if all([account_sid, auth_token, from_number]):
             try:
-                self.twilio_client = Client(account_sid, auth_token)
+                # Reuse one keep-alive session so each SMS skips the TLS handshake
+                http_client = TwilioHttpClient(pool_connections=True, timeout=_NETWORK_TIMEOUT)
+                http_client.session.mount('https://', HTTPAdapter(
+                    pool_connections=8,
+                    pool_maxsize=32,
+                    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+                ))
+                self.twilio_client = Client(account_sid, auth_token, http_client=http_client)
                 self.twilio_configured = True
                 print("✅ Twilio SMS alerts configured")
             except Exception as e:
@@ -85,6 +195,13 @@ class AlertManager:
         except Exception as e:
             print(f"⚠️ Error loading recipients: {e}")
             self.alert_recipients = []
+        
+        self._index_recipients()
+    
+    def _index_recipients(self):
+        """Split recipients into prefiltered email/SMS delivery lists"""
+        self._email_recipients = [(r.get('name'), r['email']) for r in self.alert_recipients if r.get('email')]
+        self._sms_recipients = [(r.get('name'), r['phone']) for r in self.alert_recipients if r.get('phone')]
     
     def save_recipients(self, recipients_file='alert_recipients.json'):
         """Save alert recipients to file"""
@@ -101,7 +218,7 @@ class AlertManager:
     
     def send_alert(self, alert_type, location, concentration, region='Unknown', details=''):
         """
-        Send alert based on alert type
+        Queue an alert for delivery based on alert type
         
         Args:
             alert_type: 'hotspot', 'threshold', 'trend', 'new_upload'
@@ -109,7 +226,17 @@ class AlertManager:
             concentration: Measured concentration
             region: Geographic region
             details: Additional information
+        
+        Returns:
+            bool: True if the alert was queued for delivery
+        
+        Raises:
+            ValueError: If alert_type is not one of the known types
         """
+        # Checked here - the worker thread could only print the failure
+        if alert_type not in self._templates:
+            raise ValueError(f"Unknown alert type: {alert_type}")
+        
         alert_data = {
             'timestamp': datetime.now().isoformat(),
             'type': alert_type,
@@ -119,6 +246,47 @@ class AlertManager:
             'details': details
         }
         
+        try:
+            self._alert_queue.put_nowait(alert_data)
+            return True
+        except queue.Full:
+            print(f"⚠️ Alert queue full - dropping {alert_type} alert for {region}")
+            return False
+    
+    def drain(self, timeout=_DRAIN_TIMEOUT):
+        """
+        Block until every queued alert has been delivered
+        
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+        
+        Returns:
+            bool: True if the queue was fully drained
+        """
+        alert_queue = self._alert_queue
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with alert_queue.all_tasks_done:
+            while alert_queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    print(f"⚠️ Gave up waiting on {alert_queue.unfinished_tasks} queued alert(s)")
+                    return False
+                alert_queue.all_tasks_done.wait(remaining)
+        return True
+    
+    def _alert_worker(self):
+        """Deliver queued alerts in the background"""
+        while True:
+            alert_data = self._alert_queue.get()
+            try:
+                self._dispatch_alert(alert_data)
+            except Exception as e:
+                print(f"❌ Alert dispatch failed: {e}")
+            finally:
+                self._alert_queue.task_done()
+    
+    def _dispatch_alert(self, alert_data):
+        """Send an alert through all configured channels"""
         # Generate alert message
         message = self._format_alert_message(alert_data)
         
@@ -143,136 +311,77 @@ class AlertManager:
     def _format_alert_message(self, alert_data):
         """Format alert message for different channels"""
         alert_type = alert_data['type']
-        location = alert_data['location']
-        concentration = alert_data['concentration']
-        region = alert_data['region']
-        
-        if alert_type == 'hotspot':
-            subject = f"🚨 MICROPLASTICS HOTSPOT ALERT: {region}"
-            body = f"""
-            HOTSPOT DETECTED in {location}, {region}
-            
-            📊 Current Concentration: {concentration:.1f} particles/m³
-    🚩 Risk Level: HIGH - Immediate Action Required
-    ⏰ Detected: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-    
-    Immediate Actions Needed:
-    • Coordinate emergency cleanup operations
-    • Implement temporary fishing restrictions  
-    • Notify local environmental authorities
-    • Increase monitoring frequency
-    
-    View details: https://microplasticsinsight.org/dashboard?region={region}
-            """
-        
-        elif alert_type == 'threshold':
-            subject = f"⚠️ THRESHOLD EXCEEDED: {region}"
-            body = f"""
-            THRESHOLD VIOLATION in {location}, {region}
-            
-            📈 Concentration: {concentration:.1f} particles/m³
-    ⛔ Exceeds threshold of 100 particles/m³ by {concentration-100:.1f}
-    📍 Location: {location}
-    
-    Recommended Actions:
-    • Schedule urgent assessment and cleanup
-    • Review local pollution sources
-    • Update community risk communications
-    
-    Full report: https://microplasticsinsight.org/reports/{region}
-            """
-        
-        elif alert_type == 'trend':
-            subject = f"📈 TREND ALERT: {region}"
-            body = f"""
-            CONCERNING TREND DETECTED in {region}
-            
-    📊 {alert_data['details']} increase over past 12 months
-    📍 Impacted Area: {location}
-    ⚠️ Projected annual increase: {concentration:.1f}%
-    
-    Proactive Measures Recommended:
-    • Review and strengthen prevention programs
-    • Increase monitoring in affected areas  
-    • Engage stakeholders in policy discussions
-    • Prepare additional cleanup resources
-    
-    Trend analysis: https://microplasticsinsight.org/trends/{region}
-            """
+        subject_template, body_template = self._templates[alert_type]
         
-        elif alert_type == 'new_upload':
-            subject = f"🆕 NEW CITIZEN REPORT: {region}"
-            body = f"""
-            NEW CITIZEN SCIENCE CONTRIBUTION
-                        
-            👤 Reported by community member
-    📷 Photo evidence of plastic debris
-    📍 Location: {location}, {region}
-    🏷️ Type: {alert_data['details']}
-    ⏰ Reported: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-    
-    Actions Required:
-    • Verify and validate citizen report
-    • Add to official monitoring database
-    • Consider for cleanup prioritization
-    • Acknowledge contributor publicly
-    
-    View contribution: https://microplasticsinsight.org/contributions/{alert_data['contribution_id']}
-            """
+        concentration = alert_data['concentration']
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        context = {
+            'location': alert_data['location'],
+            'region': alert_data['region'],
+            'details': alert_data['details'],
+            'contribution_id': alert_data.get('contribution_id', ''),
+            'concentration': f"{concentration:.1f}",
+            'excess': f"{concentration - 100:.1f}",
+            'now': now
+        }
         
         return {
-            'subject': subject,
-            'body': body.strip(),
-            'summary': f"{alert_type.upper()}: {location} - {concentration:.1f} particles/m³"
+            'subject': subject_template.substitute(context),
+            'body': body_template.substitute(context).strip(),
+            'summary': f"{alert_type.upper()}: {alert_data['location']} - {concentration:.1f} particles/m³",
+            'time': now
         }
     
     def _send_email_alert(self, message, alert_data):
         """Send email alert to recipients"""
         try:
-            for recipient in self.alert_recipients:
-                if not recipient.get('email'):
-                    continue
-                
-                msg = MIMEMultipart()
-                msg['From'] = self.smtp_config['user']
-                msg['To'] = recipient['email']
-                msg['Subject'] = message['subject']
+            recipients = self._email_recipients
+            if not recipients:
+                return True
+            
+            # The body is identical for every recipient, so build the message once
+            # and deliver it in a single SMTP transaction (recipients go in the envelope)
+            msg = MIMEMultipart()
+            msg['From'] = self.smtp_config['user']
+            msg['To'] = self.smtp_config['user']
+            msg['Subject'] = message['subject']
+            
+            # Email body
+            body = f"""
+            <html>
+            <body>
+            <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
+                <h2 style="color: #d32f2f;">Microplastics Alert System</h2>
                 
-                # Email body
-                body = f"""
-                <html>
-                <body>
-                <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
-                    <h2 style="color: #d32f2f;">Microplastics Alert System</h2>
+                <div style="background-color: #f5f5f5; padding: 20px; border-left: 4px solid #d32f2f;">
+                    <h3 style="margin-top: 0;">{message['subject']}</h3>
+                    <p><strong>Time:</strong> {message['time']} UTC</p>
+                    <p><strong>Priority:</strong> {self._get_priority(alert_data['type'])}</p>
+                    {message['body']}
                     
-                    <div style="background-color: #f5f5f5; padding: 20px; border-left: 4px solid #d32f2f;">
-                        <h3 style="margin-top: 0;">{message['subject']}</h3>
-                        <p><strong>Time:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}</p>
-                        <p><strong>Priority:</strong> {self._get_priority(alert_data['type'])}</p>
-                        {message['body']}
-                        
-                        <hr style="margin: 20px 0;">
-                        <p style="color: #666; font-size: 12px;">
-                            This is an automated alert from the Microplastics Insight Platform.<br>
-                            For more information: <a href="https://microplasticsinsight.org">Visit Platform</a>
-                        </p>
-                    </div>
+                    <hr style="margin: 20px 0;">
+                    <p style="color: #666; font-size: 12px;">
+                        This is an automated alert from the Microplastics Insight Platform.<br>
+                        For more information: <a href="https://microplasticsinsight.org">Visit Platform</a>
+                    </p>
                 </div>
-                </body>
-                </html>
-                """
-                
-                msg.attach(MimeText(body, 'html'))
-                
-                # Send email
-                server = smtplib.SMTP(self.smtp_config['server'], self.smtp_config['port'])
-                server.starttls()
-                server.login(self.smtp_config['user'], self.smtp_config['password'])
-                text = msg.as_string()
-                server.sendmail(self.smtp_config['user'], recipient['email'], text)
-                server.quit()
-                
-                print(f"✅ Email alert sent to {recipient['name']} ({recipient['email']})")
+            </div>
+            </body>
+            </html>
+            """
+            
+            msg.attach(MIMEText(body, 'html'))
+            text = msg.as_string()
+            
+            # Send email
+            server = smtplib.SMTP(self.smtp_config['server'], self.smtp_config['port'], timeout=_NETWORK_TIMEOUT)
+            server.starttls()
+            server.login(self.smtp_config['user'], self.smtp_config['password'])
+            server.sendmail(self.smtp_config['user'], [email for _, email in recipients], text)
+            server.quit()
+            
+            for name, email in recipients:
+                print(f"✅ Email alert sent to {name} ({email})")
             
             return True
             
@@ -283,25 +392,25 @@ class AlertManager:
     def _send_sms_alert(self, message, alert_data):
         """Send SMS alert to recipients"""
         try:
-            for recipient in self.alert_recipients:
-                if not recipient.get('phone') or not self.twilio_configured:
-                    continue
-                
-                sms_body = f"""
-                Microplastics Alert: {message['summary']}
-                Location: {alert_data['location']}
-                Priority: {self._get_priority(alert_data['type'])}
-                Details: {alert_data['details'][:100]}...
-                View: https://microplasticsinsight.org
-                """
-                
-                message = self.twilio_client.messages.create(
-                    body=sms_body.strip(),
-                    from_=os.getenv('TWILIO_PHONE_NUMBER'),
-                    to=recipient['phone']
+            if not self.twilio_configured:
+                return False
+            
+            sms_body = f"""
+            Microplastics Alert: {message['summary']}
+            Location: {alert_data['location']}
+            Priority: {self._get_priority(alert_data['type'])}
+            Details: {alert_data['details'][:100]}...
+            View: https://microplasticsinsight.org
+            """.strip()
+            
+            for name, phone in self._sms_recipients:
+                sms = self.twilio_client.messages.create(
+                    body=sms_body,
+                    from_=self._twilio_from,
+                    to=phone
                 )
                 
-                print(f"✅ SMS alert sent to {recipient['name']} ({recipient['phone']}) - SID: {message.sid}")
+                print(f"✅ SMS alert sent to {name} ({phone}) - SID: {sms.sid}")
             
             return True
             
@@ -311,13 +420,7 @@ class AlertManager:
     
     def _get_priority(self, alert_type):
         """Get alert priority level"""
-        priority_map = {
-            'hotspot': 'HIGH',
-            'threshold': 'MEDIUM', 
-            'trend': 'MEDIUM',
-            'new_upload': 'LOW'
-        }
-        return priority_map.get(alert_type, 'LOW')
+        return self._priority_map.get(alert_type, 'LOW')
     
     def _log_alert(self, alert_data, success):
         """Log alert to file"""
@@ -332,7 +435,7 @@ class AlertManager:
             # Append to log file
             log_file = 'alerts_log.jsonl'
             with open(log_file, 'a') as f:
-                f.write(json.dumps(log_entry) + '\n')
+                f.write(json.dumps(log_entry, default=float) + '\n')
             
         except Exception as e:
             print(f"⚠️ Alert logging failed: {e}")
@@ -342,9 +445,35 @@ class AlertManager:
         if len(data) == 0:
             return None
         
-        avg_conc = data['concentration'].mean()
-        max_conc = data['concentration'].max()
+        return self._check_region_stats(region, data['concentration'].mean(), data['concentration'].max())
+    
+    def check_threshold_alerts_bulk(self, data):
+        """
+        Check thresholds for every region in one grouped pass
+        
+        Args:
+            data: DataFrame with 'region' and 'concentration' columns
+        
+        Returns:
+            dict: region -> alert result (see check_threshold_alert)
+        """
+        if len(data) == 0:
+            return {}
+        
+        stats = data.groupby('region', sort=False)['concentration'].agg(['mean', 'max'])
+        limit = self.thresholds['concentration']
+        flagged = stats[(stats['mean'] > limit) | (stats['max'] > limit * 2)]
         
+        results = dict.fromkeys(stats.index, False)
+        for region, avg_conc, max_conc in zip(flagged.index, flagged['mean'].to_numpy(), flagged['max'].to_numpy()):
+            results[region] = self._check_region_stats(region, avg_conc, max_conc)
+        
+        return results
+    
+    def _check_region_stats(self, region, avg_conc, max_conc):
+        """Send the alert (if any) triggered by a region's mean/peak concentration"""
+        # float32 columns aggregate to np.float32, which json can't serialize in _log_alert
+        avg_conc, max_conc = float(avg_conc), float(max_conc)
         if avg_conc > self.thresholds['concentration']:
             return self.send_alert(
                 alert_type='threshold',
@@ -376,20 +505,35 @@ class AlertManager:
         }
         
         self.alert_recipients.append(recipient)
+        self._index_recipients()
         self.save_recipients()
         print(f"✅ Added recipient: {name}")
         return recipient
 
-# Global alert manager instance
-alert_manager = AlertManager()
+# Global alert manager instance (created on first use)
+_alert_manager = None
+_alert_manager_lock = threading.Lock()
+
+def get_alert_manager():
+    """Return the shared AlertManager, creating it on first use"""
+    global _alert_manager
+    if _alert_manager is None:
+        with _alert_manager_lock:
+            if _alert_manager is None:
+                _alert_manager = AlertManager()
+    return _alert_manager
 
 def send_alert(location, concentration, region='Unknown', alert_type='threshold', details=''):
     """Convenience function to send alerts"""
-    return alert_manager.send_alert(alert_type, location, concentration, region, details)
+    return get_alert_manager().send_alert(alert_type, location, concentration, region, details)
 
 def check_data_thresholds(data, region):
     """Check if dataset triggers any alerts"""
-    return alert_manager.check_threshold_alert(data, region)
+    return get_alert_manager().check_threshold_alert(data, region)
+
+def check_all_region_thresholds(data):
+    """Check every region in the dataset for threshold alerts"""
+    return get_alert_manager().check_threshold_alerts_bulk(data)
 
 # Example usage and testing
 if __name__ == "__main__":
@@ -406,6 +550,6 @@ if __name__ == "__main__":
     print(f"Threshold alert test: {'✅ Triggered' if alert_triggered else 'ℹ️ No alert'}")
     
     # Test adding recipient
-    alert_manager.add_recipient("Test User", "test@example.com", "+1234567890", "tester")
+    get_alert_manager().add_recipient("Test User", "test@example.com", "+1234567890", "tester")
     
     print("\nAlert system ready for use!")
\ No newline at end of file
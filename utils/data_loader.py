@@ -4,6 +4,30 @@ import os
 import numpy as np
 from datetime import datetime
 
+try:
+    import pyarrow  # noqa: F401 - multithreaded CSV parsing when available
+    _CSV_ENGINE = 'pyarrow'
+except ImportError:
+    _CSV_ENGINE = 'c'
+
+# Repeated string columns stored as Categorical (integer codes) once at load time
+_CATEGORY_COLUMNS = ('polymer_type', 'source')
+
+# Numeric columns parsed straight to compact dtypes (missing columns are ignored)
+_CSV_DTYPES = {
+    'latitude': 'float32',
+    'longitude': 'float32',
+    'concentration': 'float32'
+}
+
+def _read_csv(file_path):
+    """Read a data CSV with dtype hints, falling back to plain parsing for messy user data"""
+    try:
+        return pd.read_csv(file_path, engine=_CSV_ENGINE, dtype=_CSV_DTYPES)
+    except (ValueError, TypeError, KeyError):
+        # Non-numeric values in a numeric column - let the cleaning step coerce them
+        return pd.read_csv(file_path, engine=_CSV_ENGINE)
+
 def load_microplastics_data(file_path='data/sample_data.csv'):
     """
     Load and process microplastics data from CSV or generate sample data
@@ -11,7 +35,7 @@ def load_microplastics_data(file_path='data/sample_data.csv'):
     try:
         if os.path.exists(file_path):
             # Load real data
-            df = pd.read_csv(file_path)
+            df = _read_csv(file_path)
         else:
             # Generate sample data matching NOAA format
             df = generate_sample_data()
@@ -42,63 +66,83 @@ def load_microplastics_data(file_path='data/sample_data.csv'):
                 else:
                     df[col] = 'Unknown'
         
-        # Data cleaning
-        df['latitude'] = pd.to_numeric(df['latitude'], errors='coerce')
-        df['longitude'] = pd.to_numeric(df['longitude'], errors='coerce')
-        df['concentration'] = pd.to_numeric(df['concentration'], errors='coerce').fillna(0)
-        df['year'] = pd.to_numeric(df['year'], errors='coerce').fillna(datetime.now().year)
+        # Filter out missing/invalid coordinates with a single mask (NaN fails every bound)
+        lat = pd.to_numeric(df['latitude'], errors='coerce').to_numpy(dtype=np.float32, na_value=np.nan)
+        lon = pd.to_numeric(df['longitude'], errors='coerce').to_numpy(dtype=np.float32, na_value=np.nan)
+        valid = (lat >= -90) & (lat <= 90) & (lon >= -180) & (lon <= 180)
+        df = df[valid].copy()
+        df['latitude'] = lat[valid]
+        df['longitude'] = lon[valid]
+        
+        # Data cleaning (columns already parsed as numbers skip the coercion pass)
+        for col in ('concentration', 'year'):
+            if not pd.api.types.is_numeric_dtype(df[col]):
+                df[col] = pd.to_numeric(df[col], errors='coerce')
+        df['concentration'] = df['concentration'].fillna(0)
+        df['year'] = df['year'].fillna(datetime.now().year)
+        for col in _CATEGORY_COLUMNS:
+            df[col] = df[col].astype('category')
         
         # Add region information based on coordinates
         df['region'] = assign_regions(df['latitude'], df['longitude'])
         
-        # Filter out invalid coordinates
-        df = df[(df['latitude'].between(-90, 90)) & (df['longitude'].between(-180, 180))]
-        
         return df
         
     except Exception as e:
         print(f"Error loading data: {e}")
         return generate_sample_data()
 
+# Sample data distributions (hoisted so the generator doesn't rebuild them per call)
+_SAMPLE_YEARS = np.arange(2010, 2025, dtype=np.int16)
+_SAMPLE_YEAR_P = np.linspace(0.05, 0.25, len(_SAMPLE_YEARS))
+_SAMPLE_YEAR_P /= _SAMPLE_YEAR_P.sum()
+
+_POLYMER_TYPES = np.array([
+    'Polyethylene (PE)', 'Polypropylene (PP)', 'Polystyrene (PS)', 
+    'Polyethylene terephthalate (PET)', 'Polyvinyl chloride (PVC)',
+    'Polycarbonate (PC)', 'Polyamide (PA)', 'Polyurethane (PU)'
+])
+_POLYMER_P = [0.25, 0.20, 0.15, 0.12, 0.10, 0.08, 0.05, 0.05]
+
+_SOURCES = np.array([
+    'Wastewater effluent', 'Stormwater runoff', 'Atmospheric deposition',
+    'Fishing gear', 'Shipping', 'Aquaculture', 'Landfill leachate'
+])
+_SOURCE_P = [0.25, 0.20, 0.15, 0.15, 0.10, 0.08, 0.07]
+
+_METHODS = np.array(['Nets', 'Pumps', 'Grab samples'])
+
 def generate_sample_data(n_samples=1000):
     """Generate realistic sample microplastics data"""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     
     # Generate coordinates (focus on coastal areas)
-    lons = np.random.normal(0, 60, n_samples)
-    lats = np.random.normal(0, 30, n_samples)
+    lons = rng.normal(0, 60, n_samples).astype(np.float32)
+    lats = rng.normal(0, 30, n_samples).astype(np.float32)
     
     # Adjust for coastal bias
-    coastal_bias = np.random.exponential(1, n_samples)
-    lats = np.clip(lats + coastal_bias * np.sign(lats) * 0.1, -90, 90)
+    coastal_bias = rng.exponential(1, n_samples).astype(np.float32)
+    np.clip(lats + coastal_bias * np.sign(lats) * 0.1, -90, 90, out=lats)
     
     # Years (2010-2024)
-    years = np.random.choice(range(2010, 2025), n_samples, p=np.linspace(0.05, 0.25, 15))
+    years = rng.choice(_SAMPLE_YEARS, n_samples, p=_SAMPLE_YEAR_P)
     
     # Concentrations (log-normal distribution)
-    concentrations = np.random.lognormal(3, 1, n_samples)
-    concentrations = np.clip(concentrations, 0.1, 500)
+    concentrations = rng.lognormal(3, 1, n_samples).astype(np.float32)
+    np.clip(concentrations, 0.1, 500, out=concentrations)
     
     # Polymer types (realistic distribution)
-    polymers = np.random.choice([
-        'Polyethylene (PE)', 'Polypropylene (PP)', 'Polystyrene (PS)', 
-        'Polyethylene terephthalate (PET)', 'Polyvinyl chloride (PVC)',
-        'Polycarbonate (PC)', 'Polyamide (PA)', 'Polyurethane (PU)'
-    ], n_samples, p=[0.25, 0.20, 0.15, 0.12, 0.10, 0.08, 0.05, 0.05])
+    polymers = rng.choice(_POLYMER_TYPES, n_samples, p=_POLYMER_P)
     
     # Sources
-    sources = np.random.choice([
-        'Wastewater effluent', 'Stormwater runoff', 'Atmospheric deposition',
-        'Fishing gear', 'Shipping', 'Aquaculture', 'Landfill leachate'
-    ], n_samples, p=[0.25, 0.20, 0.15, 0.15, 0.10, 0.08, 0.07])
+    sources = rng.choice(_SOURCES, n_samples, p=_SOURCE_P)
     
-    # Sample dates
-    base_date = datetime(2010, 1, 1)
-    sample_dates = [base_date.replace(year=int(y)) + pd.Timedelta(days=np.random.randint(0, 365)) 
-                    for y in years]
+    # Sample dates (random day within each sample's year)
+    sample_dates = ((years - 1970).astype('datetime64[Y]').astype('datetime64[D]')
+                    + rng.integers(0, 365, n_samples).astype('timedelta64[D]'))
     
     data = pd.DataFrame({
-        'sample_id': range(1, n_samples + 1),
+        'sample_id': np.arange(1, n_samples + 1, dtype=np.int32),
         'latitude': lats,
         'longitude': lons,
         'concentration': concentrations,
@@ -106,16 +150,16 @@ def generate_sample_data(n_samples=1000):
         'year': years,
         'polymer_type': polymers,
         'source': sources,
-        'method': np.random.choice(['Nets', 'Pumps', 'Grab samples'], n_samples),
-        'depth': np.random.uniform(0, 200, n_samples),
-        'salinity': np.random.uniform(25, 38, n_samples),
-        'temperature': np.random.normal(15, 8, n_samples)
+        'method': rng.choice(_METHODS, n_samples),
+        'depth': rng.uniform(0, 200, n_samples).astype(np.float32),
+        'salinity': rng.uniform(25, 38, n_samples).astype(np.float32),
+        'temperature': rng.normal(15, 8, n_samples).astype(np.float32)
     })
     
     return data
 
 def assign_regions(latitude, longitude):
-    """Assign geographic regions based on coordinates"""
+    """Assign geographic regions based on coordinates (as a Categorical, so region filters compare integer codes)"""
     regions = []
     
     for lat, lon in zip(latitude, longitude):
@@ -149,7 +193,7 @@ def assign_regions(latitude, longitude):
         
         regions.append(region)
     
-    return regions
+    return pd.Categorical(regions)
 
 def get_additives_info():
     """Load polymer additives information from JSON or return sample data"""
@@ -301,11 +345,9 @@ def get_sample_locations(n=50):
         (-33.8, 151.2),  # Sydney
     ]
     
-    locations = []
-    for lat, lon in coastal_regions * (n // len(coastal_regions) + 1):
-        # Add some variation around coastal points
-        noise_lat = np.random.normal(0, 0.5)
-        noise_lon = np.random.normal(0, 0.5)
-        locations.append((lat + noise_lat, lon + noise_lon))
+    # Cycle through the coastal points and add some variation around each
+    base = np.asarray(coastal_regions)
+    points = np.tile(base, (n // len(base) + 1, 1))[:n]
+    points += np.random.default_rng().normal(0, 0.5, points.shape)
     
-    return locations[:n]
\ No newline at end of file
+    return list(map(tuple, points.tolist()))
\ No newline at end of file
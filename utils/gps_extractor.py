@@ -1,8 +1,82 @@
 import exifread
-from PIL import Image
-from PIL.ExifTags import TAGS
+import hashlib
 import io
+import logging
+import mmap
+import multiprocessing
+import os
+import threading
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, replace
 from datetime import datetime
+from functools import lru_cache, wraps
+
+try:
+    from exifread.core.exceptions import ExifError
+except ImportError:  # exifread < 3.0
+    ExifError = ()
+
+logger = logging.getLogger(__name__)
+
+# Replaced by numba.prange once a kernel is compiled
+prange = range
+
+def _lazy_njit(*signature, **options):
+    """
+    Compile the decorated function with numba.njit on its first call
+    
+    numba is optional and takes longer to import than the rest of this module,
+    so it is only loaded when a kernel actually runs. Without numba the plain
+    Python function is used.
+    """
+    def decorator(func):
+        compiled = None
+        
+        @wraps(func)
+        def wrapper(*args):
+            nonlocal compiled
+            if compiled is None:
+                try:
+                    import numba
+                except ImportError:
+                    compiled = func
+                else:
+                    func.__globals__['prange'] = numba.prange
+                    compiled = numba.njit(*signature, **options)(func)
+            return compiled(*args)
+        return wrapper
+    return decorator
+
+_JPEG_SOI = b'\xff\xd8'
+_EXIF_HEADER = b'Exif\x00\x00'
+
+# Parsed GPS results keyed by a digest of the EXIF payload (oldest entries evicted first)
+_GPS_CACHE = {}
+_GPS_CACHE_SIZE = 1024
+_MISSING = object()
+
+# Worker processes for concurrent uploads (created on first use)
+_EXIF_POOL = None
+_EXIF_POOL_LOCK = threading.Lock()
+
+@dataclass(slots=True, frozen=True)
+class GpsInfo:
+    """GPS metadata extracted from an image"""
+    lat: float | None = None
+    lon: float | None = None
+    alt: float | None = None
+    timestamp: str | None = None
+    direction: float | None = None
+    geohash: str | None = None
+    valid: bool = False
+    lat_dms: str | None = None
+    lon_dms: str | None = None
+    
+    def to_dict(self):
+        """Plain dict of the fields that are set (for JSON serialization)"""
+        return {name: value for name, value in asdict(self).items() if value is not None}
 
 def extract_gps_from_image(image_path_or_bytes, return_dms=False):
     """
@@ -13,71 +87,182 @@ def extract_gps_from_image(image_path_or_bytes, return_dms=False):
         return_dms: If True, return coordinates in degrees/minutes/seconds format
     
     Returns:
-        dict: GPS info or None if not found
+        GpsInfo: GPS info or None if not found
     """
     try:
-        # Handle both file path and bytes
-        if isinstance(image_path_or_bytes, str):
-            # File path
-            with open(image_path_or_bytes, 'rb') as f:
-                tags = exifread.process_file(f, stop_tag='EXIF DateTimeDigitized')
-        else:
-            # Bytes
-            image = Image.open(io.BytesIO(image_path_or_bytes))
-            exif_data = image._getexif()
-            if not exif_data:
+        # File paths and bytes share one code path - only the EXIF segment is read, never the image data
+        with _open_image_stream(image_path_or_bytes) as stream:
+            head = stream.read(2)
+            if not head:
                 return None
-            
-            # Convert PIL exif to exifread format
-            tags = {}
-            for tag_id, value in exif_data.items():
-                tag = TAGS.get(tag_id, tag_id)
-                tags[tag] = value
-        
-        # Check for GPS info
-        gps_info = {}
-        
-        # Latitude
-        if 'GPS GPSLatitude' in tags and 'GPS GPSLatitudeRef' in tags:
-            lat = _convert_to_degrees(tags['GPS GPSLatitude'], tags['GPS GPSLatitudeRef'])
-            gps_info['lat'] = lat
-        
-        # Longitude  
-        if 'GPS GPSLongitude' in tags and 'GPS GPSLongitudeRef' in tags:
-            lon = _convert_to_degrees(tags['GPS GPSLongitude'], tags['GPS GPSLongitudeRef'])
-            gps_info['lon'] = lon
-        
-        # Altitude
-        if 'GPS GPSAltitude' in tags:
-            alt = float(tags['GPS GPSAltitude'].values[0])
-            if 'GPS GPSAltitudeRef' in tags and int(tags['GPS GPSAltitudeRef'].values[0]) == 1:
-                alt = -alt  # Below sea level
-            gps_info['alt'] = alt
-        
-        # Timestamp
-        if 'EXIF DateTimeDigitized' in tags:
-            timestamp_str = str(tags['EXIF DateTimeDigitized'])
-            try:
-                gps_info['timestamp'] = datetime.strptime(timestamp_str, '%Y:%m:%d %H:%M:%S').isoformat()
-            except ValueError:
-                pass
-        
-        # Direction
-        if 'GPS GPSImgDirection' in tags:
-            gps_info['direction'] = float(tags['GPS GPSImgDirection'].values[0])
-        
-        if gps_info:
-            gps_info['valid'] = True
-            if return_dms:
-                gps_info['lat_dms'] = _degrees_to_dms(gps_info['lat'])
-                gps_info['lon_dms'] = _degrees_to_dms(gps_info['lon'])
-            return gps_info
+            if head != _JPEG_SOI:
+                # Other formats are handed to exifread as-is so it can detect them itself. They
+                # aren't cached: their GPS IFD can sit anywhere in the file, so no bounded read
+                # yields a safe cache key
+                stream.seek(0)
+                gps_info = _parse_gps_payload(stream)
+            else:
+                exif_payload = _read_exif_segment(stream)
+                if not exif_payload:
+                    return None
+                
+                # Identical uploads (retries, re-analysis) reuse the previously parsed result
+                digest = hashlib.blake2b(exif_payload, digest_size=16).digest()
+                gps_info = _GPS_CACHE.get(digest, _MISSING)
+                if gps_info is _MISSING:
+                    gps_info = _parse_gps_payload(io.BytesIO(exif_payload))
+                    if len(_GPS_CACHE) >= _GPS_CACHE_SIZE:
+                        _GPS_CACHE.pop(next(iter(_GPS_CACHE)), None)
+                    _GPS_CACHE[digest] = gps_info
         
-        return None
+        if gps_info is None:
+            return None
         
-    except Exception as e:
-        print(f"Error extracting GPS: {e}")
+        if return_dms and gps_info.lat is not None and gps_info.lon is not None:
+            gps_info = replace(gps_info,
+                               lat_dms=_degrees_to_dms(gps_info.lat, False),
+                               lon_dms=_degrees_to_dms(gps_info.lon, True))
+        return gps_info
+        
+    except (ExifError, OSError, ValueError, KeyError, IndexError, ZeroDivisionError) as e:
+        logger.debug("Error extracting GPS: %s", e)
+        return None
+
+def extract_gps_async(image_path_or_bytes, return_dms=False):
+    """
+    Extract GPS info in a worker process so the caller isn't blocked
+    
+    Returns:
+        concurrent.futures.Future: resolves to the extract_gps_from_image result
+    """
+    return _get_exif_pool().submit(extract_gps_from_image, image_path_or_bytes, return_dms)
+
+def _get_exif_pool():
+    """Return the shared EXIF worker pool, creating it on first use"""
+    global _EXIF_POOL
+    if _EXIF_POOL is None:
+        with _EXIF_POOL_LOCK:
+            if _EXIF_POOL is None:
+                # The app process runs other threads (Streamlit, the alert worker), and forking
+                # a threaded process can deadlock children on locks held at fork time
+                method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+                _EXIF_POOL = ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                                 mp_context=multiprocessing.get_context(method))
+    return _EXIF_POOL
+
+def _parse_gps_payload(source):
+    """Parse GPS fields out of a stream of EXIF data or a whole image (GpsInfo, or None if no GPS data)"""
+    tags = exifread.process_file(source, stop_tag='EXIF DateTimeDigitized',
+                                 details=False, extract_thumbnail=False)
+    
+    # Only a handful of known tags are needed - fetch each once
+    lat_value, lat_ref = tags.get('GPS GPSLatitude'), tags.get('GPS GPSLatitudeRef')
+    lon_value, lon_ref = tags.get('GPS GPSLongitude'), tags.get('GPS GPSLongitudeRef')
+    alt_value, alt_ref = tags.get('GPS GPSAltitude'), tags.get('GPS GPSAltitudeRef')
+    digitized = tags.get('EXIF DateTimeDigitized')
+    direction = tags.get('GPS GPSImgDirection')
+    
+    # Check for GPS info
+    gps_info = {}
+    
+    # Latitude
+    if lat_value is not None and lat_ref is not None:
+        gps_info['lat'] = _convert_to_degrees(lat_value, lat_ref)
+    
+    # Longitude  
+    if lon_value is not None and lon_ref is not None:
+        gps_info['lon'] = _convert_to_degrees(lon_value, lon_ref)
+    
+    # Altitude
+    alt = _ratio_to_float(alt_value.values[0]) if alt_value is not None else None
+    if alt is not None:
+        if alt_ref is not None and int(alt_ref.values[0]) == 1:
+            alt = -alt  # Below sea level
+        gps_info['alt'] = alt
+    
+    # Timestamp
+    if digitized is not None:
+        timestamp = _parse_exif_timestamp(str(digitized))
+        if timestamp is not None:
+            gps_info['timestamp'] = timestamp
+    
+    # Direction
+    direction = _ratio_to_float(direction.values[0]) if direction is not None else None
+    if direction is not None:
+        gps_info['direction'] = direction
+    
+    if gps_info.get('lat') is not None and gps_info.get('lon') is not None:
+        # Geohash lets callers bucket/deduplicate by prefix instead of range queries
+        gps_info['geohash'] = _geohash_encode(gps_info['lat'], gps_info['lon'], 8)
+    
+    if gps_info:
+        return GpsInfo(valid=True, **gps_info)
+    
+    return None
+
+def _ratio_to_float(ratio):
+    """Float value of an EXIF rational (None for the 0/0 cameras write when the value is unknown)"""
+    if getattr(ratio, 'den', 1) == 0:
         return None
+    return float(ratio)
+
+@lru_cache(maxsize=1024)
+def _parse_exif_timestamp(timestamp_str):
+    """Convert a fixed-width EXIF 'YYYY:MM:DD HH:MM:SS' timestamp to ISO format (None if malformed)"""
+    ts = timestamp_str
+    try:
+        return datetime(int(ts[0:4]), int(ts[5:7]), int(ts[8:10]),
+                        int(ts[11:13]), int(ts[14:16]), int(ts[17:19])).isoformat()
+    except ValueError:
+        return None
+
+@contextmanager
+def _open_image_stream(image_path_or_bytes):
+    """
+    Yield a seekable stream over an image path or bytes
+    
+    Files are memory-mapped, so only the pages the EXIF reader touches are loaded.
+    """
+    if not isinstance(image_path_or_bytes, (str, os.PathLike)):
+        with io.BytesIO(image_path_or_bytes) as stream:
+            yield stream
+        return
+    
+    with open(image_path_or_bytes, 'rb') as f:
+        try:
+            stream = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be mapped
+            stream = io.BytesIO()
+    with stream:
+        yield stream
+
+def _read_exif_segment(stream):
+    """
+    Return the TIFF payload of a JPEG's APP1/EXIF segment, skipping all image data
+    
+    The stream must be positioned just past the SOI marker.
+    Returns None if the JPEG has no EXIF segment.
+    """
+    while True:
+        marker = stream.read(4)
+        if len(marker) < 4 or marker[0] != 0xFF:
+            return None
+        
+        marker_type = marker[1]
+        length = int.from_bytes(marker[2:4], 'big')
+        if marker_type == 0xE1:
+            segment = stream.read(length - 2)
+            if segment.startswith(_EXIF_HEADER):
+                return segment[len(_EXIF_HEADER):]
+        elif marker_type in (0xDA, 0xD9):
+            # Start of scan / end of image - metadata segments all come before this
+            return None
+        else:
+            stream.seek(length - 2, 1)
+
+# Hemisphere reference -> sign of the decimal coordinate
+_SIGN_TABLE = {'N': 1.0, 'E': 1.0, 'S': -1.0, 'W': -1.0}
 
 def _convert_to_degrees(value, ref):
     """Convert GPS coordinates from EXIF format to degrees"""
@@ -85,36 +270,161 @@ def _convert_to_degrees(value, ref):
         # EXIF GPS values are in format: degrees, minutes, seconds
         d, m, s = value.values
         
-        # Convert to decimal degrees
-        degrees = float(d.num) / float(d.den)
-        minutes = float(m.num) / float(m.den) / 60.0
-        seconds = float(s.num) / float(s.den) / 3600.0
+        # Convert to decimal degrees (degrees/minutes are almost always whole numbers)
+        if d.den == 1 and m.den == 1:
+            base = d.num + m.num / 60.0
+        else:
+            base = float(d.num) / float(d.den) + float(m.num) / float(m.den) / 60.0
         
-        decimal_degrees = degrees + minutes + seconds
+        decimal_degrees = base + s.num / (s.den * 3600.0)
         
         # Apply reference direction
-        if ref in ['S', 'W']:
-            decimal_degrees = -decimal_degrees
-        
-        return round(decimal_degrees, 6)
+        return round(decimal_degrees * _SIGN_TABLE.get(str(ref), 1.0), 6)
         
     except (AttributeError, ValueError, ZeroDivisionError):
         return None
 
-def _degrees_to_dms(degrees):
-    """Convert decimal degrees to degrees/minutes/seconds string"""
+# Weights turning (degrees, minutes, seconds) into decimal degrees
+_DMS_WEIGHTS = np.array([1.0, 1.0 / 60.0, 1.0 / 3600.0])
+
+def convert_to_degrees_batch(rationals, refs):
+    """
+    Convert many EXIF GPS coordinates to decimal degrees at once
+    
+    Args:
+        rationals: (N, 3, 2) array of (numerator, denominator) pairs for degrees, minutes, seconds
+        refs: N hemisphere references ('N', 'S', 'E', 'W' as str or bytes)
+    
+    Returns:
+        np.ndarray: N decimal degrees (NaN where a denominator is zero)
+    """
+    rationals = np.asarray(rationals, dtype=np.float64)
+    refs = np.asarray(refs)
+    if refs.dtype.kind == 'S':
+        refs = refs.astype('U')
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        decimal_degrees = (rationals[..., 0] / rationals[..., 1]) @ _DMS_WEIGHTS
+    decimal_degrees[~np.isfinite(decimal_degrees)] = np.nan
+    
+    signs = np.where(np.isin(refs, ('S', 'W')), -1.0, 1.0)
+    return np.round(decimal_degrees * signs, 6)
+
+@_lazy_njit(cache=True, fastmath=True)
+def _dms_components(degrees):
+    """Split decimal degrees into (degrees, minutes, seconds, is_negative)"""
     is_negative = degrees < 0
     degrees = abs(degrees)
     
     d = int(degrees)
     m = int((degrees - d) * 60)
-    s = (degrees - d - m/60) * 3600
+    s = (degrees - d - m / 60) * 3600
     
-    direction = 'N' if not is_negative else 'S'
-    if isinstance(degrees, (int, float)) and degrees > 90:  # Longitude check
-        direction = 'E' if not is_negative else 'W'
+    return d, m, s, is_negative
+
+_DMS_FMT = "{:02d}° {:02d}' {:02.0f}\" {}".format
+
+def _degrees_to_dms(degrees, is_longitude=False):
+    """Convert decimal degrees to degrees/minutes/seconds string"""
+    d, m, s, is_negative = _dms_components(float(degrees))
     
-    return f"{d:02d}° {m:02d}' {s:02.0f}\" {direction}"
+    if is_longitude:
+        direction = 'W' if is_negative else 'E'
+    else:
+        direction = 'S' if is_negative else 'N'
+    
+    return _DMS_FMT(d, m, s, direction)
+
+# Coordinate validation status codes -> messages (index = code)
+_VALIDATION_MESSAGES = (
+    "Valid coordinates",
+    "Latitude must be between -90 and 90",
+    "Longitude must be between -180 and 180",
+    "Coordinates appear to be on land (integer values)"
+)
+_VALIDATION_MESSAGE_ARRAY = np.array(_VALIDATION_MESSAGES)
+
+@_lazy_njit(cache=True, parallel=True)
+def _validation_codes(lats, lons):
+    """Validation status code for each (lat, lon) pair - see _VALIDATION_MESSAGES"""
+    codes = np.zeros(lats.shape[0], dtype=np.int8)
+    for i in prange(lats.shape[0]):
+        lat = lats[i]
+        lon = lons[i]
+        if not (-90 <= lat <= 90):
+            codes[i] = 1
+        elif not (-180 <= lon <= 180):
+            codes[i] = 2
+        elif abs(lat - round(lat)) < 0.001 and abs(lon - round(lon)) < 0.001:
+            codes[i] = 3
+    return codes
+
+def validate_coordinates_array(lats, lons):
+    """
+    Validate many coordinates at once (same rules as validate_coordinates)
+    
+    Args:
+        lats: Array-like of latitudes
+        lons: Array-like of longitudes
+    
+    Returns:
+        tuple: (boolean validity mask, array of status messages)
+    """
+    codes = _validation_codes(np.ascontiguousarray(lats, dtype=np.float64),
+                              np.ascontiguousarray(lons, dtype=np.float64))
+    return codes == 0, _VALIDATION_MESSAGE_ARRAY[codes]
+
+@_lazy_njit('void(int64[:,:,:], uint8[:,:], float64[:], uint8[:], float64[:], float64[:,:])',
+            cache=True, parallel=True)
+def _gps_kernel(rationals, refs, alts, alt_refs, dirs, out):
+    """Fill out[i] with (lat, lon, alt, direction) from one image's parsed GPS tags"""
+    for i in prange(rationals.shape[0]):
+        for axis in range(2):
+            value = 0.0
+            scale = 1.0
+            for k in range(3):
+                den = rationals[i, axis * 3 + k, 1]
+                value += (rationals[i, axis * 3 + k, 0] / den if den != 0 else np.nan) * scale
+                scale /= 60.0
+            ref = refs[i, axis]
+            # 'S' (83) and 'W' (87) are negative
+            out[i, axis] = round(value * (1.0 - 2.0 * ((ref == 83) | (ref == 87))), 6)
+        
+        out[i, 2] = alts[i] * (1.0 - 2.0 * (alt_refs[i] == 1))  # 1 = below sea level
+        out[i, 3] = dirs[i]
+
+def gps_batch_from_rationals(rationals, refs, alts=None, alt_refs=None, dirs=None):
+    """
+    Compute GPS info for a batch of images from their parsed EXIF values
+    
+    Args:
+        rationals: (N, 6, 2) integer (numerator, denominator) pairs - latitude
+            degrees/minutes/seconds followed by longitude degrees/minutes/seconds
+        refs: (N, 2) latitude and longitude references ('N'/'S', 'E'/'W' as str or bytes)
+        alts: N altitudes (NaN where missing)
+        alt_refs: N altitude references (1 = below sea level)
+        dirs: N image directions (NaN where missing)
+    
+    Returns:
+        tuple: ((N, 4) array of lat, lon, alt, direction; boolean validity mask)
+    """
+    rationals = np.ascontiguousarray(rationals, dtype=np.int64)
+    n = rationals.shape[0]
+    
+    refs = np.asarray(refs)
+    if refs.dtype.kind == 'U':
+        refs = np.char.encode(refs, 'ascii')
+    refs = np.ascontiguousarray(refs.astype('S1')).view(np.uint8).reshape(n, 2)
+    
+    alts = np.full(n, np.nan) if alts is None else np.ascontiguousarray(alts, dtype=np.float64)
+    alt_refs = np.zeros(n, dtype=np.uint8) if alt_refs is None else np.ascontiguousarray(alt_refs, dtype=np.uint8)
+    dirs = np.full(n, np.nan) if dirs is None else np.ascontiguousarray(dirs, dtype=np.float64)
+    
+    out = np.empty((n, 4))
+    _gps_kernel(rationals, refs, alts, alt_refs, dirs, out)
+    
+    valid, _ = validate_coordinates_array(out[:, 0], out[:, 1])
+    return out, valid
 
 def validate_coordinates(lat, lon):
     """Validate if coordinates are reasonable"""
@@ -123,21 +433,108 @@ def validate_coordinates(lat, lon):
         lon = float(lon)
         
         if not (-90 <= lat <= 90):
-            return False, "Latitude must be between -90 and 90"
+            return False, _VALIDATION_MESSAGES[1]
         if not (-180 <= lon <= 180):
-            return False, "Longitude must be between -180 and 180"
+            return False, _VALIDATION_MESSAGES[2]
         
         # Check if coordinates are in ocean (very basic check)
         # Most land coordinates have both lat and lon as integers or have specific patterns
         if abs(lat - round(lat)) < 0.001 and abs(lon - round(lon)) < 0.001:
             # Integer coordinates are suspicious for ocean sampling
-            return False, "Coordinates appear to be on land (integer values)"
+            return False, _VALIDATION_MESSAGES[3]
         
-        return True, "Valid coordinates"
+        return True, _VALIDATION_MESSAGES[0]
         
     except (ValueError, TypeError):
         return False, "Invalid coordinate format"
 
+_GEOHASH_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+
+@lru_cache(maxsize=4096)
+def _geohash_encode(lat, lon, precision=8):
+    """Encode a coordinate as a geohash string by bit-interleaved bisection"""
+    lat_lo, lat_hi = -90.0, 90.0
+    lon_lo, lon_hi = -180.0, 180.0
+    chars = []
+    bits = 0
+    for i in range(precision * 5):
+        bits <<= 1
+        if i % 2 == 0:
+            # Even bits bisect longitude
+            mid = (lon_lo + lon_hi) / 2
+            if lon >= mid:
+                bits |= 1
+                lon_lo = mid
+            else:
+                lon_hi = mid
+        else:
+            # Odd bits bisect latitude
+            mid = (lat_lo + lat_hi) / 2
+            if lat >= mid:
+                bits |= 1
+                lat_lo = mid
+            else:
+                lat_hi = mid
+        if i % 5 == 4:
+            chars.append(_GEOHASH_BASE32[bits])
+            bits = 0
+    return ''.join(chars)
+
+def _classify_location(lat, lon):
+    """Return (ocean, region, hemisphere) for a coordinate"""
+    # Simple region classification
+    if -60 <= lat <= -30:
+        hemisphere = "Southern Hemisphere"
+        ocean = "Southern Ocean"
+    elif 30 <= lat <= 60:
+        hemisphere = "Northern Hemisphere"
+        ocean = "Northern Atlantic/Pacific"
+    else:
+        hemisphere = "Equatorial"
+        ocean = "Tropical Waters"
+    
+    # Rough longitude-based description
+    if -180 <= lon < -60:
+        region = "Eastern Pacific"
+    elif -60 <= lon < 0:
+        region = "Western Atlantic"
+    elif 0 <= lon < 60:
+        region = "Eastern Atlantic/Mediterranean"
+    elif 60 <= lon < 180:
+        region = "Indian Ocean/Western Pacific"
+    else:
+        region = "Eastern Pacific"
+    
+    return ocean, region, hemisphere
+
+def _build_region_table():
+    """
+    Precompute _classify_location for every 2-character geohash cell
+    
+    Cells that straddle (or touch) a classification boundary map to None and
+    are resolved with _classify_location at lookup time.
+    """
+    lat_step, lon_step = 180 / 32, 360 / 32
+    lat_bounds = (-60, -30, 30, 60)
+    lon_bounds = (-60, 0, 60, 180)
+    
+    table = {}
+    for i in range(32):
+        lat_lo = -90 + i * lat_step
+        lat_hi = lat_lo + lat_step
+        for j in range(32):
+            lon_lo = -180 + j * lon_step
+            lon_hi = lon_lo + lon_step
+            key = _geohash_encode(lat_lo + lat_step / 2, lon_lo + lon_step / 2, 2)
+            if (any(lat_lo <= b <= lat_hi for b in lat_bounds) or
+                    any(lon_lo <= b <= lon_hi for b in lon_bounds)):
+                table[key] = None
+            else:
+                table[key] = _classify_location(lat_lo + lat_step / 2, lon_lo + lon_step / 2)
+    return table
+
+_REGION_TABLE = _build_region_table()
+
 def estimate_location_description(lat, lon):
     """
     Generate a human-readable location description from coordinates
@@ -147,34 +544,53 @@ def estimate_location_description(lat, lon):
         lat = float(lat)
         lon = float(lon)
         
-        # Simple region classification
-        if -60 <= lat <= -30:
-            hemisphere = "Southern Hemisphere"
-            ocean = "Southern Ocean"
-        elif 30 <= lat <= 60:
-            hemisphere = "Northern Hemisphere"
-            ocean = "Northern Atlantic/Pacific"
-        else:
-            hemisphere = "Equatorial"
-            ocean = "Tropical Waters"
-        
-        # Rough longitude-based description
-        if -180 <= lon < -60:
-            region = "Eastern Pacific"
-        elif -60 <= lon < 0:
-            region = "Western Atlantic"
-        elif 0 <= lon < 60:
-            region = "Eastern Atlantic/Mediterranean"
-        elif 60 <= lon < 180:
-            region = "Indian Ocean/Western Pacific"
-        else:
-            region = "Eastern Pacific"
+        location = None
+        if -90 <= lat <= 90 and -180 <= lon <= 180:
+            location = _REGION_TABLE[_geohash_encode(lat, lon, 2)]
+        if location is None:
+            location = _classify_location(lat, lon)
+        ocean, region, hemisphere = location
         
         return f"{ocean}, {region}, {hemisphere} - Approx. {lat:.1f}°N, {lon:.1f}°E"
         
     except (ValueError, TypeError):
         return "Unknown location"
 
+# classify_batch index tables
+_BATCH_OCEANS = np.array(["Southern Ocean", "Northern Atlantic/Pacific", "Tropical Waters"])
+_BATCH_HEMISPHERES = np.array(["Southern Hemisphere", "Northern Hemisphere", "Equatorial"])
+_BATCH_REGIONS = np.array(["Eastern Pacific", "Eastern Pacific", "Western Atlantic",
+                           "Eastern Atlantic/Mediterranean", "Indian Ocean/Western Pacific",
+                           "Eastern Pacific"])
+_BATCH_LON_BINS = np.array([-180.0, -60.0, 0.0, 60.0, 180.0])
+
+def classify_batch(lats, lons, names=False):
+    """
+    Validate and classify many coordinates in one vectorized pass
+    
+    Uses the same rules as validate_coordinates and estimate_location_description.
+    
+    Args:
+        lats: Array-like of latitudes
+        lons: Array-like of longitudes
+        names: If True, return ocean/region/hemisphere names instead of indices
+    
+    Returns:
+        tuple: (validity mask, ocean index, region index), or with names=True
+            (validity mask, ocean names, region names, hemisphere names)
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    
+    valid, _ = validate_coordinates_array(lats, lons)
+    ocean_idx = np.where((lats >= -60) & (lats <= -30), 0,
+                         np.where((lats >= 30) & (lats <= 60), 1, 2))
+    region_idx = np.digitize(lons, _BATCH_LON_BINS)
+    
+    if not names:
+        return valid, ocean_idx, region_idx
+    return valid, _BATCH_OCEANS[ocean_idx], _BATCH_REGIONS[region_idx], _BATCH_HEMISPHERES[ocean_idx]
+
 # Example usage and testing
 if __name__ == "__main__":
     # Test with sample coordinates